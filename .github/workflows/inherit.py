@@ -6,6 +6,7 @@ from itertools import product
 import github3 # pip install github3.py
 
 CACHE = {}
+ISSUE_REGEX = re.compile(r"/issues/(\d+)")
 
 
 def get(what, repo, from_cache=True, **kwargs):
@@ -75,7 +76,7 @@ def copy_between_issues(repo, from_number, to_number, assignees=True, labels=Tru
     for param in what:
         fro, to = current_data[(from_number, param)], current_data[(to_number, param)]
         key = comparison_keys[param]
-        fro_items, to_items = [f[key] for f in fro], [t[key] for t in to]
+        fro_items, to_items = [f[key] for f in fro], {t[key] for t in to}
         missing = [item for item in fro_items if item not in to_items]
         if len(missing) > 0:
             add_missing(param, missing)
@@ -96,9 +97,8 @@ def find_pr_by_sha(repo, sha, state='open'):
 
 
 def find_referenced_issues(html):
-    find_issues = r"/issues/(\d+)"
     if isinstance(html, str):
-        return set(re.findall(find_issues, html))
+        return set(ISSUE_REGEX.findall(html))
     else:
         return set()
 
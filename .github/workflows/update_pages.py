@@ -75,16 +75,20 @@ def create_modulation_plan(data, task_column='semitones', sort_and_fill=True, ti
             mi = min((0, mi)) # fifths can be negative
             complete = set(range(mi, ma))
             missing = complete.difference(set(data[task_column]))
-            missing_data = pd.DataFrame.from_records([{'Start': 0,
-                                                       'Finish': 0,
-                                                       'Resource': 'local',
-                                                       task_column: m
-                                                       }
-                                                       for m in missing])
-            data = pd.concat([data, missing_data]).sort_values(task_column, ascending=False)
+            if len(missing) > 0:
+                missing_data = pd.DataFrame.from_records([{'Start': 0,
+                                                           'Finish': 0,
+                                                           'Resource': 'local',
+                                                           task_column: m
+                                                           }
+                                                           for m in missing])
+                data = pd.concat([data, missing_data])
+            data = data.sort_values(task_column, ascending=False)
         else:
-            # assuming task_column contains strings
-            data = data.sort_values(task_column, ascending=False, key=lambda S: S.str.upper())
+            # assuming task_column contains strings; the first sort makes the order of
+            # case-insensitive ties (e.g. V and v) deterministic, the stable second one keeps it
+            data = data.sort_values(task_column, ascending=False)
+            data = data.sort_values(task_column, ascending=False, key=lambda S: S.str.upper(), kind='mergesort')
 
     if globalkey is not None:
         title += f" ({globalkey})"
@@ -277,7 +281,8 @@ def get_phraseends(at, column='mn_fraction'):
     """ If make_gantt_data() returned quarterbeats positions, pass column='quarterbeats'
     """
     if column == 'mn_fraction' and 'mn_fraction' not in at.columns:
-        mn_fraction = at.mn + (at.mn_onset.astype(float)/at.timesig.map(frac).astype(float))
+        timesig2float = {ts: float(frac(ts)) for ts in at.timesig.unique()}
+        mn_fraction = at.mn + (at.mn_onset.astype(float)/at.timesig.map(timesig2float))
         at.insert(at.columns.get_loc('mn')+1, 'mn_fraction', mn_fraction)
     return at.loc[at.phraseend.isin([r"\\", "}", "}{"]), column].to_list()
 
@@ -318,7 +323,6 @@ def write_gantt_charts(args):
         logger.debug(f"Creating Gantt data for {fname}...")
         data = make_gantt_data(at)
         phrases = get_phraseends(at)
-        data.sort_values(args.yaxis, ascending=False, inplace=True)
         logger.debug(f"Making and storing Gantt chart for {fname}...")
         fig = create_modulation_plan(data, title=f"{fname}", globalkey=globalkey, task_column=args.yaxis, phraseends=phrases)
         out_path = os.path.join(gantt_path, f'{fname}.html')
@@ -333,7 +337,7 @@ def write_to_file(args, filename, content_str):
         os.path.dirname(fname)
     )  # in case the file name included path components
     with open(fname, "w", encoding="utf-8") as f:
-        f.writelines(content_str)
+        f.write(content_str)
 
 
 def write_gantt_file(args):